@@ -40,4 +40,8 @@ class BaseLLMProvider(ABC):
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the provider is properly configured and available"""
-        pass
\ No newline at end of file
+        pass
+    
+    def close(self):
+        """Release any resources (e.g. HTTP connection pools) held by the provider"""
+        pass
@@ -1,8 +1,10 @@
 """OpenAI LLM provider implementation"""
 
+import atexit
 import json
 from typing import Dict, List, Any, Optional
-from openai import OpenAI
+import httpx
+from openai import OpenAI, DefaultHttpxClient
 from .base import BaseLLMProvider
 from ..config.settings import settings
 
@@ -16,8 +18,13 @@ class OpenAIProvider(BaseLLMProvider):
             try:
                 self.client = OpenAI(
                     api_key=settings.openai_api_key,
-                    timeout=settings.timeout_openai
+                    timeout=settings.timeout_openai,
+                    # Keep-alive pool shared by every agent using this provider
+                    http_client=DefaultHttpxClient(
+                        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+                    )
                 )
+                atexit.register(self.close)
             except Exception as e:
                 print(f"Warning: Failed to initialize OpenAI client: {e}")
                 self.client = None
@@ -173,4 +180,9 @@ class OpenAIProvider(BaseLLMProvider):
     
     def is_available(self) -> bool:
         """Check if OpenAI provider is available"""
-        return self.client is not None and settings.openai_api_key is not None
\ No newline at end of file
+        return self.client is not None and settings.openai_api_key is not None
+    
+    def close(self):
+        """Close pooled HTTP connections held by the OpenAI client"""
+        if self.client is not None:
+            self.client.close()
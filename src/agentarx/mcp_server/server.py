@@ -1,5 +1,10 @@
 """FastMCP Server for AgentArx Tools"""
 
+import errno
+import functools
+import re
+import shlex
+import shutil
 import subprocess
 import sys
 from typing import Optional
@@ -71,6 +76,65 @@ class CrawlResponse(BaseModel):
 # Tool Implementations
 # ============================================================================
 
+# Characters that require /bin/sh: pipes, redirects, globs, expansion, chaining
+_SHELL_SYNTAX = re.compile(r'[|&;<>()$`*?\[\]{}~!#\n]')
+
+# Shell builtins: POSIX special and regular built-ins plus common extensions.
+# echo/printf/test are included because their builtin behaviour (escapes,
+# option handling) differs from the coreutils binaries.
+_SHELL_BUILTINS = frozenset({
+    # POSIX special built-ins
+    'break', ':', 'continue', '.', 'eval', 'exec', 'exit', 'export',
+    'readonly', 'return', 'set', 'shift', 'times', 'trap', 'unset',
+    # POSIX regular built-ins
+    'alias', 'bg', 'cd', 'command', 'false', 'fc', 'fg', 'getopts', 'hash',
+    'jobs', 'kill', 'newgrp', 'pwd', 'read', 'true', 'type', 'ulimit',
+    'umask', 'unalias', 'wait',
+    # Common extensions and builtin-shadowed utilities
+    'echo', 'printf', 'test', '[', 'local', 'source', 'let', 'declare',
+    'typeset', 'builtin', 'history', 'disown', 'enable', 'help', 'shopt'
+})
+
+
+def _split_command(command: str) -> Optional[list]:
+    """Return argv for commands that can skip the shell, None otherwise"""
+    if _SHELL_SYNTAX.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or argv[0] in _SHELL_BUILTINS or '=' in argv[0]:
+        return None
+    # Let the shell report missing/non-executable programs (127/126)
+    if shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_python(code: str):
+    """Compile Python source once; agents frequently re-run identical snippets"""
+    return compile(code, '<agentarx>', 'exec')
+
+
+def _run_command(command: str, argv: Optional[list], timeout: int) -> subprocess.CompletedProcess:
+    """Run argv directly when possible, otherwise (or on fallback) via /bin/sh"""
+    if argv is not None:
+        try:
+            result = subprocess.run(argv, capture_output=True, text=True, timeout=timeout)
+        except OSError as e:
+            # Executable scripts without a shebang: sh runs those itself
+            if e.errno != errno.ENOEXEC:
+                raise
+        else:
+            if result.returncode < 0:
+                # Report signal deaths the way the shell does (128 + N)
+                result.returncode = 128 - result.returncode
+            return result
+    return subprocess.run(command, shell=True, capture_output=True, text=True, timeout=timeout)
+
+
 @mcp.tool()
 def execute_bash(command: str, timeout: int = 300) -> dict:
     """
@@ -83,14 +147,9 @@ def execute_bash(command: str, timeout: int = 300) -> dict:
     Returns:
         Dictionary with stdout, stderr, return_code, and success status
     """
+    argv = _split_command(command)
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
+        result = _run_command(command, argv, timeout)
         
         return {
             "stdout": result.stdout,
@@ -105,6 +164,22 @@ def execute_bash(command: str, timeout: int = 300) -> dict:
             "return_code": -1,
             "success": False
         }
+    except FileNotFoundError:
+        # Mirror the shell's "command not found" result for direct execs
+        return {
+            "stdout": "",
+            "stderr": f"{argv[0]}: command not found",
+            "return_code": 127,
+            "success": False
+        }
+    except PermissionError:
+        # Mirror the shell's "permission denied" result for direct execs
+        return {
+            "stdout": "",
+            "stderr": f"{argv[0]}: Permission denied",
+            "return_code": 126,
+            "success": False
+        }
     except Exception as e:
         return {
             "stdout": "",
@@ -135,7 +210,7 @@ def execute_python(code: str, timeout: int = 300) -> dict:
     
     try:
         with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
-            exec(code, {})
+            exec(_compile_python(code), {})
         
         return {
             "stdout": stdout_capture.getvalue(),
@@ -1,5 +1,7 @@
 """Cooperative agent orchestrator - coordinates autonomous agents in sequence"""
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Dict, Any, Optional
 from pathlib import Path
 
@@ -264,9 +266,10 @@ class AgentArxOrchestrator:
                 # Check if attack requests more work
                 if attack_data.needs_more_recon:
                     print(f"\n🔄 Attack agent requests additional reconnaissance")
-                    recon_requests = [r.specific_tasks for r in attack_data.requests 
-                                     if r.request_type == 'more_recon']
-                    recon_requests = [task for sublist in recon_requests for task in sublist]
+                    recon_requests = list(chain.from_iterable(
+                        r.specific_tasks for r in attack_data.requests
+                        if r.request_type == 'more_recon'
+                    ))
                     recon_data = self.recon_agent.gather_additional(
                         recon_requests, recon_data, target_config
                     )
@@ -377,51 +380,39 @@ class AgentArxOrchestrator:
             FileNotFoundError: If required phase file doesn't exist
             ValueError: If session or target validation fails
         """
-        recon_data = None
-        analysis_data = None
-        attack_data = None
-        
-        # Load recon if starting from analysis or later
-        if start_from in ['analysis', 'attack', 'report']:
-            recon_dict = self.session_manager.load_phase_result(
-                'recon',
-                expected_session_id=session_id,
-                expected_target_url=target_url
-            )
-            if not recon_dict:
-                raise FileNotFoundError(
-                    f"Cannot start from {start_from}: recon.json not found. "
-                    "Run full assessment first or start from recon phase."
-                )
-            recon_data = self.session_manager.reconstruct_dataclass(ReconData, recon_dict)
-        
-        # Load analysis if starting from attack or report
-        if start_from in ['attack', 'report']:
-            analysis_dict = self.session_manager.load_phase_result(
-                'analysis',
-                expected_session_id=session_id,
-                expected_target_url=target_url
-            )
-            if not analysis_dict:
-                raise FileNotFoundError(
-                    f"Cannot start from {start_from}: analysis.json not found. "
-                    "Run full assessment first or start from analysis phase."
-                )
-            analysis_data = self.session_manager.reconstruct_dataclass(AnalysisData, analysis_dict)
-        
-        # Load attack if starting from report
-        if start_from == 'report':
-            attack_dict = self.session_manager.load_phase_result(
-                'attack',
-                expected_session_id=session_id,
-                expected_target_url=target_url
-            )
-            if not attack_dict:
+        # Phases that must already exist on disk for each starting point
+        required = {
+            'analysis': ['recon'],
+            'attack': ['recon', 'analysis'],
+            'report': ['recon', 'analysis', 'attack']
+        }.get(start_from, [])
+        
+        # Issue the reads concurrently - each is an independent open + parse
+        phase_dicts = {}
+        if required:
+            with ThreadPoolExecutor(max_workers=len(required)) as executor:
+                futures = {
+                    phase: executor.submit(
+                        self.session_manager.load_phase_result,
+                        phase,
+                        expected_session_id=session_id,
+                        expected_target_url=target_url
+                    )
+                    for phase in required
+                }
+                phase_dicts = {phase: future.result() for phase, future in futures.items()}
+        
+        # Validate in phase order so the earliest missing phase is reported
+        for phase in required:
+            if not phase_dicts[phase]:
                 raise FileNotFoundError(
-                    f"Cannot start from report: attack.json not found. "
-                    "Run full assessment first or start from attack phase."
+                    f"Cannot start from {start_from}: {phase}.json not found. "
+                    f"Run full assessment first or start from {phase} phase."
                 )
-            attack_data = self.session_manager.reconstruct_dataclass(AttackData, attack_dict)
+        
+        recon_data = self.session_manager.reconstruct_dataclass(ReconData, phase_dicts.get('recon'))
+        analysis_data = self.session_manager.reconstruct_dataclass(AnalysisData, phase_dicts.get('analysis'))
+        attack_data = self.session_manager.reconstruct_dataclass(AttackData, phase_dicts.get('attack'))
         
         return recon_data, analysis_data, attack_data
     
@@ -1,21 +1,30 @@
 """Parser for attack scenario definitions (JSON format)"""
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
-from .attack_scenario_schemas import AttackDefinition, Step, ParsedJson
+from typing import IO, Dict, Any, List
+import orjson
+from .attack_scenario_schemas import AttackDefinition, ParsedJson
 
 
 class AttackScenarioParser:
     """Parser for attack scenario JSON files"""
     
+    # Parsed files kept per parser, keyed by (path, mtime_ns, size)
+    CACHE_SIZE = 128
+    
     def __init__(self):
-        pass
+        self._parse_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._parse_path)
     
     def parse_file(self, file_path: str) -> ParsedJson:
         """
         Parse a JSON file containing attack definitions
         
+        Results are cached until the file changes (mtime or size) and are
+        shared between callers, so treat them as read-only.
+        
         Args:
             file_path: Path to the JSON file
             
@@ -23,20 +32,61 @@ class AttackScenarioParser:
             ParsedJson object with structured data
         """
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"JSON file not found: {file_path}")
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON file not found: {file_path}") from None
         
         if not path.suffix.lower() == '.json':
             raise ValueError(f"Only JSON files are supported. Got: {path.suffix}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            raw_content = json.load(f)
+        return self._parse_cached(str(path.absolute()), st.st_mtime_ns, st.st_size)
+    
+    def clear_cache(self):
+        """Drop all cached parse_file results"""
+        self._parse_cached.cache_clear()
+    
+    def _parse_path(self, path: str, mtime_ns: int, size: int) -> ParsedJson:
+        """Read and parse one file (mtime_ns/size only key the cache)"""
+        with open(path, 'rb') as f:
+            raw_content = orjson.loads(f.read())
+        
+        return self.parse_dict(raw_content, path)
+    
+    def parse_stream(self, stream: IO, source: str = '<stream>') -> ParsedJson:
+        """
+        Parse attack definitions from an open text or binary stream
+        
+        Args:
+            stream: File-like object holding the JSON document
+            source: Name recorded as the file path of the result
+            
+        Returns:
+            ParsedJson object with structured data
+        """
+        try:
+            raw_content = orjson.loads(stream.read())
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in {source}: {e}") from e
+        return self.parse_dict(raw_content, source)
+    
+    def parse_dict(self, raw_content: Dict[str, Any], source: str = '<memory>') -> ParsedJson:
+        """
+        Parse attack definitions from already-loaded JSON content
         
+        Args:
+            raw_content: Decoded JSON document
+            source: Name recorded as the file path of the result
+            
+        Returns:
+            ParsedJson object with structured data
+        """
         # Convert raw JSON to our structured format
         attack_definition = self._convert_json_to_attack_definition(raw_content)
         
-        return ParsedJson(
-            file_path=str(path.absolute()),
+        # Fields are already validated/trusted - skip a second validation pass
+        return ParsedJson.model_construct(
+            file_path=source,
             attack_definition=attack_definition,
             raw_content=raw_content
         )
@@ -45,8 +95,6 @@ class AttackScenarioParser:
         """Convert JSON format to AttackDefinition model"""
         from ..config.settings import settings
         
-        steps = []
-        
         # Extract steps from JSON format
         step_data = raw_data.get('steps', [])
         constraints = raw_data.get('constraints', {})
@@ -57,50 +105,56 @@ class AttackScenarioParser:
         if system_prompt == 'SYSTEM_PROMPT':
             system_prompt = settings.system_prompt
         
-        for i, step_raw in enumerate(step_data):
-            if isinstance(step_raw, dict):
-                # Use the first example command as the default command
-                examples = step_raw.get('examples', [])
-                command = examples[0] if examples else ''
-                
-                step = Step(
-                    name=step_raw.get('name', f'Step {i+1}'),
-                    description=step_raw.get('description', ''),
-                    tool='bash',  # Default tool, can be overridden by execution logic
-                    command=command,
-                    expected_output=None,
-                    timeout=timeout
-                )
-                steps.append(step)
+        # Plain dicts - validated together with the definition below.
+        # The first example command is the default command; the tool can be
+        # overridden by execution logic.
+        steps = [
+            {
+                'name': step_raw.get('name', f'Step {i+1}'),
+                'description': step_raw.get('description', ''),
+                'tool': 'bash',
+                'command': (step_raw.get('examples') or [''])[0],
+                'expected_output': None,
+                'timeout': timeout
+            }
+            for i, step_raw in enumerate(step_data)
+            if isinstance(step_raw, dict)
+        ]
         
         # Generate ID from goal if not present
         step_id = f"JSON-{hash(raw_data.get('goal', 'unknown')) % 10000:04d}"
         
-        return AttackDefinition(
-            id=step_id,
-            name=raw_data.get('goal', 'Unnamed Task'),
-            description=raw_data.get('goal', ''),
-            category='json_format',  # Will be refined by execution logic
-            severity='medium',
-            steps=steps,
-            metadata={
+        # Single pydantic-core validation pass builds the definition and all steps
+        return AttackDefinition.model_validate({
+            'id': step_id,
+            'name': raw_data.get('goal', 'Unnamed Task'),
+            'description': raw_data.get('goal', ''),
+            'category': 'json_format',  # Will be refined by execution logic
+            'severity': 'medium',
+            'steps': steps,
+            'metadata': {
                 'system_prompt': system_prompt,
                 'constraints': constraints,
                 'stopping_conditions': constraints.get('stopping_conditions', []),
                 'response_format': constraints.get('response_format', {}),
                 'examples': raw_data.get('examples', [])
             }
-        )
+        })
 
     
     def parse_multiple_files(self, file_paths: List[str]) -> List[ParsedJson]:
-        """Parse multiple JSON files"""
-        results = []
-        for file_path in file_paths:
+        """Parse multiple JSON files concurrently, keeping input order"""
+        def parse(file_path):
             try:
-                result = self.parse_file(file_path)
-                results.append(result)
+                return self.parse_file(file_path), None
             except Exception as e:
-                print(f"Error parsing {file_path}: {e}")
-                continue
-        return results
\ No newline at end of file
+                return None, e
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=min(32, len(file_paths) or 1)) as executor:
+            for file_path, (result, error) in zip(file_paths, executor.map(parse, file_paths)):
+                if error is not None:
+                    print(f"Error parsing {file_path}: {error}")
+                    continue
+                results.append(result)
+        return results
@@ -1,24 +1,139 @@
 """Session management for tracking assessment state"""
 
-import json
+import logging
+import os
+import tempfile
+import time
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, ClassVar, Set, Tuple
 from dataclasses import fields
 
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _field_names(dataclass_type) -> frozenset:
+    """Return the field names of a dataclass type (cached per type)"""
+    return frozenset(f.name for f in fields(dataclass_type))
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize obj as indented JSON bytes (same layout as json.dumps indent=2)"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+def _indent_fragment(raw: bytes, depth: int) -> bytes:
+    """Shift indented JSON bytes so they nest at the given depth (2 spaces per level)"""
+    # Literal newlines only occur between tokens - strings escape them
+    return raw.replace(b'\n', b'\n' + b'  ' * depth)
+
+
+# Saved-file wrapper in the exact layout of an indent=2 dump of the equivalent
+# dict - only the values are encoded per save
+_ENVELOPE_TEMPLATE = (
+    b'{\n'
+    b'  "phase": %b,\n'
+    b'  "session_id": %b,\n'
+    b'  "target_url": %b,\n'
+    b'  "attack_name": %b,\n'
+    b'  "attack_id": %b,\n'
+    b'  "timestamp": %b,\n'
+    b'  "data": %b\n'
+    b'}'
+)
+
+
+def _write_bytes(path: str, buf: bytes):
+    """
+    Atomically write buf to path with raw os-level calls.
+    
+    Data goes to a temporary file in the same directory which is then renamed
+    over path, so readers never observe a partially written file.
+    """
+    parent, name = os.path.split(path)
+    try:
+        # Unique per call - threads may save the same file concurrently
+        fd, tmp_path = tempfile.mkstemp(dir=parent, prefix=name + '.', suffix='.tmp')
+    except FileNotFoundError:
+        # Directory removed after it was memoized (e.g. results/ cleaned up
+        # under a long-running web process) - recreate it and retry once
+        SessionManager._created_dirs.discard(Path(parent))
+        SessionManager._ensure_dir(Path(parent))
+        fd, tmp_path = tempfile.mkstemp(dir=parent, prefix=name + '.', suffix='.tmp')
+    try:
+        try:
+            # mkstemp creates 0600; saved results stay world-readable
+            os.fchmod(fd, 0o644)
+            view = memoryview(buf)
+            while view:
+                # os.write may write fewer bytes than requested
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class SessionManager:
     """Manages assessment sessions - generates IDs and saves final results"""
     
+    # Directories already created by any instance in this process
+    _created_dirs: ClassVar[Set[Path]] = set()
+    
     def __init__(self, base_path: str = "results", scenario_name: str = None):
         self.base_path = Path(base_path)
         self.scenario_name = scenario_name
         if scenario_name:
             self.scenario_path = self.base_path / scenario_name
-            self.scenario_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.scenario_path)
         else:
             self.scenario_path = self.base_path
-        self.base_path.mkdir(parents=True, exist_ok=True)
+        self._scenario_str = os.fspath(self.scenario_path)
+        self._ensure_dir(self.base_path)
+        # phase name -> (phase_data as saved, its indented JSON bytes)
+        self._phase_bytes: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
+        # Save timestamps have one-second resolution; format each second once
+        self._last_ts_s = 0
+        self._last_ts_str = ''
+    
+    @classmethod
+    def _ensure_dir(cls, path: Path):
+        """Create path (and parents) once per process, skipping repeat mkdir calls"""
+        if path in cls._created_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        cls._created_dirs.add(path)
+    
+    def _timestamp(self) -> str:
+        """Return the current local time in ISO format, cached per second"""
+        now_s = int(time.time())
+        if now_s != self._last_ts_s:
+            self._last_ts_s = now_s
+            self._last_ts_str = datetime.fromtimestamp(now_s).isoformat()
+        return self._last_ts_str
+    
+    def _envelope(self, phase: str, session_id: str, data_bytes: bytes,
+                  target_url: str = None, attack_name: str = None,
+                  attack_id: str = None) -> bytes:
+        """Render the saved-file envelope around already encoded data"""
+        return _ENVELOPE_TEMPLATE % (
+            _dump_json(phase),
+            _dump_json(session_id),
+            _dump_json(target_url),
+            _dump_json(attack_name),
+            _dump_json(attack_id),
+            _dump_json(self._timestamp()),
+            _indent_fragment(data_bytes, 1)
+        )
     
     def create_session(self, attack_scenario_filename: str) -> str:
         """
@@ -36,7 +151,9 @@ class SessionManager:
         filename = Path(attack_scenario_filename).stem
         self.scenario_name = filename
         self.scenario_path = self.base_path / filename
-        self.scenario_path.mkdir(parents=True, exist_ok=True)
+        self._scenario_str = os.fspath(self.scenario_path)
+        self._ensure_dir(self.scenario_path)
+        self._phase_bytes.clear()
         session_id = f"session_{filename}"
         return session_id
     
@@ -51,24 +168,31 @@ class SessionManager:
         Returns:
             Path to saved results file
         """
-        # Wrap with metadata
-        wrapped_data = {
-            'phase': 'report',
-            'session_id': session_id,
-            'target_url': assessment_data.get('target_url'),
-            'attack_name': assessment_data.get('attack_name'),
-            'attack_id': assessment_data.get('attack_id'),
-            'timestamp': datetime.now().isoformat(),
-            'data': assessment_data
-        }
+        # Splice in phase payloads already encoded by save_phase_result
+        # rather than serializing them a second time
+        data = assessment_data
+        if self._phase_bytes:
+            for phase, (saved, raw) in self._phase_bytes.items():
+                key = f"{phase}_data"
+                # Phase data may have moved on since it was saved (e.g. extra recon)
+                if key in data and data[key] == saved:
+                    if data is assessment_data:
+                        data = dict(assessment_data)
+                    data[key] = orjson.Fragment(_indent_fragment(raw, 1))
+        
+        buf = self._envelope(
+            'report', session_id, _dump_json(data),
+            target_url=assessment_data.get('target_url'),
+            attack_name=assessment_data.get('attack_name'),
+            attack_id=assessment_data.get('attack_id')
+        )
         
         # Save to fixed filename
-        result_file = self.scenario_path / "report.json"
-        with open(result_file, 'w') as f:
-            json.dump(wrapped_data, f, indent=2)
+        result_file = f"{self._scenario_str}/report.json"
+        _write_bytes(result_file, buf)
         
-        print(f"💾 Saved complete assessment to: {result_file}")
-        return result_file
+        logger.debug("Saved complete assessment to: %s", result_file)
+        return Path(result_file)
     
     def save_phase_result(self, 
                          session_id: str, 
@@ -84,7 +208,7 @@ class SessionManager:
         Args:
             session_id: Deterministic session identifier
             phase_name: Name of phase (recon, analysis, attack)
-            phase_data: Phase-specific data
+            phase_data: Phase-specific data (not to be mutated after saving)
             target_url: Target URL for validation
             attack_name: Attack name for validation
             attack_id: Attack ID for validation
@@ -92,29 +216,27 @@ class SessionManager:
         Returns:
             Path to saved phase file
         """
-        # Wrap data with metadata including run timestamp
-        wrapped_data = {
-            'phase': phase_name,
-            'session_id': session_id,
-            'target_url': target_url,
-            'attack_name': attack_name,
-            'attack_id': attack_id,
-            'timestamp': datetime.now().isoformat(),
-            'data': phase_data
-        }
+        # Encode the payload once and keep the bytes for save_assessment
+        raw = _dump_json(phase_data)
+        self._phase_bytes[phase_name] = (phase_data, raw)
+        
+        buf = self._envelope(
+            phase_name, session_id, raw,
+            target_url=target_url, attack_name=attack_name, attack_id=attack_id
+        )
         
         # Save to fixed filename
-        phase_file = self.scenario_path / f"{phase_name}.json"
-        with open(phase_file, 'w') as f:
-            json.dump(wrapped_data, f, indent=2)
+        phase_file = f"{self._scenario_str}/{phase_name}.json"
+        _write_bytes(phase_file, buf)
         
-        print(f"💾 Saved {phase_name} results to: {phase_file}")
-        return phase_file
+        logger.debug("Saved %s results to: %s", phase_name, phase_file)
+        return Path(phase_file)
     
     def load_phase_result(self, 
                          phase_name: str,
                          expected_session_id: str,
-                         expected_target_url: str = None) -> Optional[Dict[str, Any]]:
+                         expected_target_url: str = None,
+                         validate: bool = True) -> Optional[Dict[str, Any]]:
         """
         Load previously saved phase results from fixed filename.
         Validates session ID to ensure consistency.
@@ -123,6 +245,8 @@ class SessionManager:
             phase_name: Name of phase (recon, analysis, attack)
             expected_session_id: Expected session ID (deterministic)
             expected_target_url: Expected target URL for validation (optional)
+            validate: Check session/target metadata. Pass False for trusted
+                files this process wrote itself to return the data directly.
             
         Returns:
             Phase data dict (unwrapped) or None if not found
@@ -130,12 +254,19 @@ class SessionManager:
         Raises:
             ValueError: If session or metadata validation fails
         """
-        phase_file = self.scenario_path / f"{phase_name}.json"
-        if not phase_file.exists():
+        # Plain string path - this is polled, so skip per-call Path objects
+        phase_file = f"{self._scenario_str}/{phase_name}.json"
+        try:
+            with open(phase_file, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
             return None
         
-        with open(phase_file, 'r') as f:
-            wrapped_data = json.load(f)
+        wrapped_data = orjson.loads(raw)
+        
+        # Fast path: trusted file, metadata was fixed when it was written
+        if not validate:
+            return wrapped_data.get('data', {})
         
         # Validate session ID (strict - must match)
         if wrapped_data.get('session_id') != expected_session_id:
@@ -152,9 +283,9 @@ class SessionManager:
                 f"expected '{expected_target_url}', found '{wrapped_data.get('target_url')}'"
             )
         
-        print(f"📂 Loaded {phase_name} results from: {phase_file}")
-        print(f"   Session: {wrapped_data.get('session_id')}")
-        print(f"   Saved: {wrapped_data.get('timestamp')}")
+        logger.debug("Loaded %s results from: %s (session %s, saved %s)",
+                     phase_name, phase_file,
+                     wrapped_data.get('session_id'), wrapped_data.get('timestamp'))
         
         # Return unwrapped data
         return wrapped_data.get('data', {})
@@ -175,9 +306,9 @@ class SessionManager:
             return None
         
         # Get field names for the dataclass
-        field_names = {f.name for f in fields(dataclass_type)}
+        field_names = _field_names(dataclass_type)
         
-        # Filter data to only include valid fields
-        filtered_data = {k: v for k, v in data.items() if k in field_names}
+        # Filter data to only include valid fields (loop over the smaller side)
+        filtered_data = {k: data[k] for k in field_names if k in data}
         
         return dataclass_type(**filtered_data)
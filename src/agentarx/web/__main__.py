@@ -1,18 +1,28 @@
 """Run AgentArx Web UI as a module"""
 
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-env_path = Path.cwd() / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
-    print(f"✓ Loaded environment from: {env_path}")
-else:
-    print(f"⚠ No .env file found at: {env_path}")
-    print("  Please create a .env file with your OPENAI_API_KEY")
-
-from .app import run_server
+import os
 
 if __name__ == '__main__':
+    # Patch blocking calls before anything else is imported so SSE clients
+    # are served as greenlets rather than one OS thread each
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        pass
+    
+    # Import lazily so importing this module (e.g. by tooling) stays cheap
+    from dotenv import load_dotenv
+    
+    # Load environment variables from .env file
+    env_path = os.path.join(os.getcwd(), ".env")
+    if os.path.isfile(env_path):
+        load_dotenv(env_path)
+        print(f"✓ Loaded environment from: {env_path}")
+    else:
+        print(f"⚠ No .env file found at: {env_path}")
+        print("  Please create a .env file with your OPENAI_API_KEY")
+    
+    # Settings are read at import time, so the app must load after .env
+    from .app import run_server
     run_server()
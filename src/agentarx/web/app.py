@@ -1,23 +1,99 @@
 """Flask web application for AgentArx"""
 
+import errno
 import json
 import os
+import re
+import shutil
+import tempfile
 import threading
 import time
+import traceback
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 
-from flask import Flask, jsonify, request, Response, send_from_directory
+from flask import Flask, jsonify, request, Response, send_from_directory, stream_with_context
 from flask_cors import CORS
+import orjson
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml - pure Python loader
+    from yaml import SafeLoader
 
 from ..orchestrator import AgentArxOrchestrator
 from ..config.settings import settings
+from .log_tailer import LogTailer, LogSubscription
+
+@dataclass(slots=True)
+class AssessmentState:
+    """State of an assessment started from the web UI"""
+    scenario_id: str
+    status: str = 'starting'
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+
+
+# Global state for running assessments (guarded by _assessments_lock)
+running_assessments: Dict[str, AssessmentState] = {}
+_assessments_lock = threading.Lock()
+orchestrator = None
 
+# .env file is in project root - resolved once from this file's location
+APP_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+ENV_FILE = APP_ROOT / ".env"
+TARGET_CONFIG_FILE = Path("src/agentarx/config/target_config.json")
+SCENARIO_DIR = Path("attack_scenarios")
 
-# Global state for running assessments
-running_assessments: Dict[str, Dict[str, Any]] = {}
-orchestrator = None
+# Agents with editable prompt files (order used in error messages)
+_AGENT_NAMES = ('recon', 'attack', 'analyze', 'report')
+VALID_AGENTS = frozenset(_AGENT_NAMES)
+VALID_AGENTS_CSV = ", ".join(_AGENT_NAMES)
+PROMPT_DIR = Path("src/agentarx/config/prompts")
+MAX_PROMPT_SIZE = 1 << 20
+
+# Required keys when saving prompt / target configuration
+PROMPT_REQUIRED_FIELDS = ('agent_name', 'system_prompt', 'prompt_templates')
+TARGET_REQUIRED_FIELDS = ('target_id', 'name', 'network')
+TARGET_NETWORK_REQUIRED_FIELDS = ('url',)
+
+# Envelope opening for /api/results responses
+RESULTS_PREFIX = b'{"success":true,"results":'
+
+# SSE comment sent first so intermediate buffers flush immediately
+SSE_PADDING = b":" + b" " * 2048 + b"\n\n"
+
+# Pre-encoded SSE frame pieces - log frames only encode the message per line
+LOG_PREFIX = b'data: {"type":"log","message":'
+FRAME_SUFFIX = b'}\n\n'
+HEARTBEAT = b": heartbeat\n\n"
+
+# One shared log tailer per streamed session
+log_tailers: Dict[str, LogTailer] = {}
+_log_tailers_lock = threading.Lock()
+
+# Scenario file path -> (mtime_ns, size, name, category)
+_scenario_cache: Dict[str, Tuple[int, int, str, str]] = {}
+_scenario_cache_lock = threading.Lock()
+
+# ((path, mtime_ns, size), variables, raw content) of the last parsed .env
+_env_cache: Optional[Tuple[Tuple[str, int, int], List[Dict[str, Any]], str]] = None
+
+# Status endpoint name -> (monotonic time computed, payload); the UI polls these
+_status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+STATUS_TTL = 5.0
+
+# One KEY=value assignment per line: key is everything before the first '='
+# and both sides are trimmed; lines starting with '#' are comments
+ENV_LINE_RE = re.compile(r'^(?![ \t]*#)[ \t]*([^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
+
+# Variable names whose values are masked in the UI
+SENSITIVE_RE = re.compile(r'KEY|TOKEN|PASSWORD|SECRET')
 
 
 def create_app():
@@ -25,6 +101,8 @@ def create_app():
     global orchestrator
     
     app = Flask(__name__, static_folder='static', static_url_path='')
+    # Let browsers cache static assets (favicon, CSS) for a day
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 86400
     CORS(app)
     
     # Initialize orchestrator if not already done
@@ -43,7 +121,8 @@ def register_routes(app):
     @app.route('/')
     def index():
         """Serve main HTML page"""
-        return send_from_directory(app.static_folder, 'index.html')
+        # Always revalidate - the page carries the UI code
+        return send_from_directory(app.static_folder, 'index.html', max_age=0)
 
     
     @app.route('/favicon.ico')
@@ -55,32 +134,35 @@ def register_routes(app):
     @app.route('/api/config/status', methods=['GET'])
     def config_status():
         """Check configuration status"""
-        errors = []
-        
-        # Check OpenAI configuration
-        try:
-            settings.validate()
-        except ValueError as e:
-            errors.append(str(e))
-        
-        # Check LLM provider availability
-        if not orchestrator.llm_provider.is_available():
-            errors.append("LLM provider not available. Check OPENAI_API_KEY.")
+        def compute():
+            errors = []
+            
+            # Check OpenAI configuration
+            try:
+                settings.validate()
+            except ValueError as e:
+                errors.append(str(e))
+            
+            # Check LLM provider availability
+            if not orchestrator.llm_provider.is_available():
+                errors.append("LLM provider not available. Check OPENAI_API_KEY.")
+            
+            return {
+                'configured': len(errors) == 0,
+                'errors': errors
+            }
         
-        return jsonify({
-            'configured': len(errors) == 0,
-            'errors': errors
-        })
+        return jsonify(cached_status('config', compute))
 
 
     @app.route('/api/reporter/status', methods=['GET'])
     def reporter_status():
         """Get reporter type and configuration status"""
-        return jsonify({
+        return jsonify(cached_status('reporter', lambda: {
             'reporter_type': settings.reporter_type,
             'reporter_name': orchestrator.reporter.get_name(),
             'configured': orchestrator.reporter.is_configured()
-        })
+        }))
 
 
     @app.route('/api/scenarios', methods=['GET'])
@@ -117,7 +199,7 @@ def register_routes(app):
             }), 400
         
         # Check if scenario exists
-        scenario_file = Path("attack_scenarios") / f"{scenario_id}.json"
+        scenario_file = SCENARIO_DIR / f"{scenario_id}.json"
         if not scenario_file.exists():
             return jsonify({
                 'success': False,
@@ -127,24 +209,19 @@ def register_routes(app):
         # Create session ID
         session_id = f"session_{scenario_id}"
         
-        # Check if already running
-        if session_id in running_assessments and running_assessments[session_id]['status'] == 'running':
-            return jsonify({
-                'success': False,
-                'error': 'Scenario is already running',
-                'session_id': session_id,
-                'status': 'running'
-            }), 409
-        
-        # Initialize assessment state
-        running_assessments[session_id] = {
-            'scenario_id': scenario_id,
-            'status': 'starting',
-            'start_time': None,
-            'end_time': None,
-            'result': None,
-            'error': None
-        }
+        # Check if already running and claim the session atomically
+        with _assessments_lock:
+            current = running_assessments.get(session_id)
+            if current is not None and current.status in ('starting', 'running'):
+                return jsonify({
+                    'success': False,
+                    'error': 'Scenario is already running',
+                    'session_id': session_id,
+                    'status': current.status
+                }), 409
+            
+            # Initialize assessment state
+            running_assessments[session_id] = AssessmentState(scenario_id=scenario_id)
         
         # Start assessment in background thread
         thread = threading.Thread(
@@ -165,28 +242,28 @@ def register_routes(app):
     @app.route('/api/status/<session_id>', methods=['GET'])
     def get_status(session_id: str):
         """Get status of a running or completed assessment"""
-        if session_id not in running_assessments:
-            return jsonify({
-                'success': False,
-                'error': 'Session not found'
-            }), 404
-        
-        assessment = running_assessments[session_id]
-        
-        response = {
-            'success': True,
-            'session_id': session_id,
-            'scenario_id': assessment['scenario_id'],
-            'status': assessment['status'],
-            'start_time': assessment.get('start_time'),
-            'end_time': assessment.get('end_time'),
-        }
-        
-        if assessment['status'] == 'failed':
-            response['error'] = assessment.get('error')
-        
-        if assessment['status'] == 'completed':
-            response['result'] = assessment.get('result')
+        with _assessments_lock:
+            assessment = running_assessments.get(session_id)
+            if assessment is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Session not found'
+                }), 404
+            
+            response = {
+                'success': True,
+                'session_id': session_id,
+                'scenario_id': assessment.scenario_id,
+                'status': assessment.status,
+                'start_time': assessment.start_time,
+                'end_time': assessment.end_time,
+            }
+            
+            if assessment.status == 'failed':
+                response['error'] = assessment.error
+            
+            if assessment.status == 'completed':
+                response['result'] = assessment.result
         
         return jsonify(response)
 
@@ -197,84 +274,71 @@ def register_routes(app):
         
         def generate():
             """Generator function that yields log lines"""
+            tailer = None
             try:
-                log_file = Path("logs") / f"{session_id}.log"
+                # Padding comment pushes the stream past proxy buffering thresholds
+                yield SSE_PADDING
                 
                 # Send initial connection message
-                yield f"data: {json.dumps({'type': 'log', 'message': 'Connecting to log stream...'})}\n\n"
-                
-                # Wait for log file to be created (up to 30 seconds)
-                wait_time = 0
-                while not log_file.exists() and wait_time < 30:
-                    time.sleep(1)
-                    wait_time += 1
-                
-                if not log_file.exists():
-                    error_msg = f"Log file not found after {wait_time} seconds: {log_file}"
-                    print(f"SSE Error: {error_msg}")
-                    yield f"data: {json.dumps({'type': 'error', 'message': error_msg})}\n\n"
-                    return
+                yield sse_log_frame('Connecting to log stream...')
                 
-                yield f"data: {json.dumps({'type': 'log', 'message': f'Log file found, streaming from {log_file}'})}\n\n"
+                tailer, sub = acquire_log_tailer(session_id)
+                reported_dropped = 0
                 
-                # Start tailing the file
-                last_heartbeat = time.time()
-                last_size = 0
-                
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    # Send existing content
-                    existing_content = f.read()
-                    if existing_content:
-                        for line in existing_content.splitlines():
-                            yield f"data: {json.dumps({'type': 'log', 'message': line})}\n\n"
+                while True:
+                    # Wait for new lines; a timeout means the stream is idle
+                    with tailer.cond:
+                        tailer.cond.wait_for(lambda: sub.events or tailer.done, timeout=15)
+                        events = list(sub.events)
+                        sub.events.clear()
+                        dropped = sub.dropped
+                        finished = tailer.done
+                    
+                    if dropped > reported_dropped:
+                        message = f'Log backlog truncated: {dropped - reported_dropped} lines dropped'
+                        yield sse_frame({'type': 'warn', 'message': message})
+                        reported_dropped = dropped
                     
-                    last_size = f.tell()
+                    for event in events:
+                        yield sse_log_frame(event['message'])
                     
-                    # Keep tailing new content
-                    while True:
-                        # Check for new content
-                        f.seek(last_size)
-                        new_content = f.read()
-                        
-                        if new_content:
-                            for line in new_content.splitlines():
-                                yield f"data: {json.dumps({'type': 'log', 'message': line})}\n\n"
-                            last_size = f.tell()
-                            last_heartbeat = time.time()
+                    if events:
+                        continue
+                    
+                    if finished:
+                        if tailer.error:
+                            print(f"SSE Error: {tailer.error}")
+                            yield sse_frame({'type': 'error', 'message': tailer.error})
                         else:
-                            # Check if assessment is complete
-                            if session_id in running_assessments:
-                                status = running_assessments[session_id]['status']
-                                if status in ['completed', 'failed']:
-                                    # Send completion message
-                                    yield f"data: {json.dumps({'type': 'status', 'status': status})}\n\n"
-                                    break
-                            
-                            # Send heartbeat every 15 seconds to keep connection alive
-                            current_time = time.time()
-                            if current_time - last_heartbeat > 15:
-                                yield f": heartbeat\n\n"
-                                last_heartbeat = current_time
-                            
-                            # No new data, wait a bit
-                            time.sleep(0.5)
+                            # Send completion message
+                            with _assessments_lock:
+                                status = running_assessments[session_id].status
+                            yield sse_frame({'type': 'status', 'status': status})
+                        break
+                    
+                    # Send heartbeat after 15 idle seconds to keep connection alive
+                    yield HEARTBEAT
             
             except GeneratorExit:
                 # Client disconnected, clean up silently
                 pass
             except Exception as e:
                 # Log server-side errors
-                import traceback
                 error_trace = traceback.format_exc()
                 print(f"SSE Stream Error: {error_trace}")
                 try:
-                    yield f"data: {json.dumps({'type': 'error', 'message': f'Stream error: {str(e)}'})}\n\n"
+                    yield sse_frame({'type': 'error', 'message': f'Stream error: {str(e)}'})
                 except:
                     pass
+            finally:
+                if tailer is not None:
+                    release_log_tailer(session_id, tailer, sub)
         
-        response = Response(generate(), mimetype='text/event-stream')
+        response = Response(stream_with_context(generate()), mimetype='text/event-stream')
         response.headers['Cache-Control'] = 'no-cache'
         response.headers['X-Accel-Buffering'] = 'no'
+        # Compressing middleware/proxies would buffer events until close
+        response.headers['Content-Encoding'] = 'identity'
         return response
 
 
@@ -285,27 +349,38 @@ def register_routes(app):
         scenario_id = session_id.replace('session_', '')
         result_file = Path("results") / scenario_id / "report.json"
         
-        if not result_file.exists():
+        try:
+            st = os.stat(result_file)
+        except FileNotFoundError:
             return jsonify({
                 'success': False,
                 'error': 'Results not found'
             }), 404
         
-        with open(result_file, 'r') as f:
-            results = json.load(f)
-        
-        return jsonify({
-            'success': True,
-            'results': results
-        })
+        # Unchanged report - let the client reuse its copy without reading the file
+        etag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
+        
+        with open(result_file, 'rb') as f:
+            st = os.fstat(f.fileno())
+            raw = f.read()
+        
+        # report.json is already JSON - splice its bytes into the envelope
+        # instead of parsing and re-serializing it
+        response = Response(RESULTS_PREFIX + raw + b'}', mimetype='application/json')
+        response.set_etag(f"{st.st_mtime_ns:x}-{st.st_size:x}")
+        response.last_modified = st.st_mtime
+        response.cache_control.no_cache = True
+        return response
 
 
     @app.route('/api/config/env', methods=['GET'])
     def get_env_config():
         """Get environment variables for editing"""
-        # .env file is in project root - navigate from this file's location
-        app_root = Path(__file__).resolve().parent.parent.parent.parent
-        env_file = app_root / ".env"
+        env_file = ENV_FILE
         
         if not env_file.exists():
             return jsonify({
@@ -314,31 +389,7 @@ def register_routes(app):
             }), 404
         
         try:
-            with open(env_file, 'r') as f:
-                content = f.read()
-            
-            # Parse .env file preserving comments
-            variables = []
-            lines = content.split('\n')
-            
-            for line in lines:
-                stripped = line.strip()
-                if not stripped or stripped.startswith('#'):
-                    continue
-                    
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Detect sensitive fields
-                    is_sensitive = any(s in key.upper() for s in ['KEY', 'TOKEN', 'PASSWORD', 'SECRET'])
-                    
-                    variables.append({
-                        'key': key,
-                        'value': value,
-                        'is_sensitive': is_sensitive
-                    })
+            variables, content = load_env_variables(env_file)
             
             return jsonify({
                 'success': True,
@@ -356,9 +407,7 @@ def register_routes(app):
     @app.route('/api/config/env', methods=['POST'])
     def save_env_config():
         """Save environment variables"""
-        # .env file is in project root - navigate from this file's location
-        app_root = Path(__file__).resolve().parent.parent.parent.parent
-        env_file = app_root / ".env"
+        env_file = ENV_FILE
         
         try:
             data = request.get_json()
@@ -375,12 +424,10 @@ def register_routes(app):
             if env_file.exists():
                 with open(env_file, 'r') as f:
                     current_content = f.read()
-            
-            # Create backup
-            if env_file.exists():
+                
+                # Create backup (in-kernel copy)
                 backup_file = env_file.with_suffix('.env.backup')
-                with open(backup_file, 'w') as f:
-                    f.write(current_content)
+                shutil.copyfile(env_file, backup_file)
             
             # Build new content preserving comments
             new_lines = []
@@ -412,8 +459,7 @@ def register_routes(app):
                     new_lines.append(f"{var['key']}={var['value']}")
             
             # Write new content
-            with open(env_file, 'w') as f:
-                f.write('\n'.join(new_lines))
+            atomic_write_text(env_file, '\n'.join(new_lines))
             
             return jsonify({
                 'success': True,
@@ -430,15 +476,13 @@ def register_routes(app):
     @app.route('/api/config/prompts/<agent_name>', methods=['GET'])
     def get_prompt_config(agent_name: str):
         """Get agent prompt configuration"""
-        valid_agents = ['recon', 'attack', 'analyze', 'report']
-        
-        if agent_name not in valid_agents:
+        if agent_name not in VALID_AGENTS:
             return jsonify({
                 'success': False,
-                'error': f'Invalid agent name. Must be one of: {", ".join(valid_agents)}'
+                'error': f'Invalid agent name. Must be one of: {VALID_AGENTS_CSV}'
             }), 400
         
-        prompt_file = Path(f"src/agentarx/config/prompts/{agent_name}_agent.yaml")
+        prompt_file = PROMPT_DIR / f"{agent_name}_agent.yaml"
         
         if not prompt_file.exists():
             return jsonify({
@@ -466,15 +510,13 @@ def register_routes(app):
     @app.route('/api/config/prompts/<agent_name>', methods=['POST'])
     def save_prompt_config(agent_name: str):
         """Save agent prompt configuration"""
-        valid_agents = ['recon', 'attack', 'analyze', 'report']
-        
-        if agent_name not in valid_agents:
+        if agent_name not in VALID_AGENTS:
             return jsonify({
                 'success': False,
-                'error': f'Invalid agent name. Must be one of: {", ".join(valid_agents)}'
+                'error': f'Invalid agent name. Must be one of: {VALID_AGENTS_CSV}'
             }), 400
         
-        prompt_file = Path(f"src/agentarx/config/prompts/{agent_name}_agent.yaml")
+        prompt_file = PROMPT_DIR / f"{agent_name}_agent.yaml"
         
         try:
             data = request.get_json()
@@ -486,10 +528,15 @@ def register_routes(app):
                     'error': 'No content provided'
                 }), 400
             
+            if len(content.encode('utf-8')) > MAX_PROMPT_SIZE:
+                return jsonify({
+                    'success': False,
+                    'error': f'Prompt file too large (limit {MAX_PROMPT_SIZE} bytes)'
+                }), 413
+            
             # Validate YAML syntax
-            import yaml
             try:
-                parsed = yaml.safe_load(content)
+                parsed = yaml.load(content, Loader=SafeLoader)
             except yaml.YAMLError as e:
                 return jsonify({
                     'success': False,
@@ -497,8 +544,7 @@ def register_routes(app):
                 }), 400
             
             # Validate required fields
-            required_fields = ['agent_name', 'system_prompt', 'prompt_templates']
-            missing = [f for f in required_fields if f not in parsed]
+            missing = [f for f in PROMPT_REQUIRED_FIELDS if f not in parsed]
             
             if missing:
                 return jsonify({
@@ -509,14 +555,10 @@ def register_routes(app):
             # Create backup
             if prompt_file.exists():
                 backup_file = prompt_file.with_suffix('.yaml.backup')
-                with open(prompt_file, 'r') as f:
-                    backup_content = f.read()
-                with open(backup_file, 'w') as f:
-                    f.write(backup_content)
+                shutil.copyfile(prompt_file, backup_file)
             
             # Save new content
-            with open(prompt_file, 'w') as f:
-                f.write(content)
+            atomic_write_text(prompt_file, content)
             
             return jsonify({
                 'success': True,
@@ -533,15 +575,13 @@ def register_routes(app):
     @app.route('/api/config/prompts/<agent_name>/reset', methods=['POST'])
     def reset_prompt_config(agent_name: str):
         """Reset agent prompt to backup/default"""
-        valid_agents = ['recon', 'attack', 'analyze', 'report']
-        
-        if agent_name not in valid_agents:
+        if agent_name not in VALID_AGENTS:
             return jsonify({
                 'success': False,
-                'error': f'Invalid agent name. Must be one of: {", ".join(valid_agents)}'
+                'error': f'Invalid agent name. Must be one of: {VALID_AGENTS_CSV}'
             }), 400
         
-        prompt_file = Path(f"src/agentarx/config/prompts/{agent_name}_agent.yaml")
+        prompt_file = PROMPT_DIR / f"{agent_name}_agent.yaml"
         backup_file = prompt_file.with_suffix('.yaml.backup')
         
         try:
@@ -550,8 +590,7 @@ def register_routes(app):
                 with open(backup_file, 'r') as f:
                     default_content = f.read()
                 
-                with open(prompt_file, 'w') as f:
-                    f.write(default_content)
+                atomic_write_text(prompt_file, default_content)
                 
                 return jsonify({
                     'success': True,
@@ -579,7 +618,7 @@ def register_routes(app):
     @app.route('/api/config/target', methods=['GET'])
     def get_target_config():
         """Get current target configuration"""
-        config_file = Path("src/agentarx/config/target_config.json")
+        config_file = TARGET_CONFIG_FILE
         
         if not config_file.exists():
             return jsonify({
@@ -610,7 +649,7 @@ def register_routes(app):
     @app.route('/api/config/target', methods=['POST'])
     def save_target_config():
         """Save target configuration"""
-        config_file = Path("src/agentarx/config/target_config.json")
+        config_file = TARGET_CONFIG_FILE
         
         try:
             # Get JSON from request
@@ -623,8 +662,7 @@ def register_routes(app):
                 }), 400
             
             # Validate required fields
-            required_fields = ['target_id', 'name', 'network']
-            missing_fields = [f for f in required_fields if f not in new_config]
+            missing_fields = [f for f in TARGET_REQUIRED_FIELDS if f not in new_config]
             
             if missing_fields:
                 return jsonify({
@@ -634,8 +672,7 @@ def register_routes(app):
             
             # Validate network object
             if 'network' in new_config:
-                network_required = ['url']
-                network_missing = [f for f in network_required if f not in new_config['network']]
+                network_missing = [f for f in TARGET_NETWORK_REQUIRED_FIELDS if f not in new_config['network']]
                 if network_missing:
                     return jsonify({
                         'success': False,
@@ -645,14 +682,10 @@ def register_routes(app):
             # Create backup of existing config
             if config_file.exists():
                 backup_file = config_file.with_suffix('.json.backup')
-                with open(config_file, 'r') as f:
-                    backup_content = f.read()
-                with open(backup_file, 'w') as f:
-                    f.write(backup_content)
+                shutil.copyfile(config_file, backup_file)
             
             # Save new config
-            with open(config_file, 'w') as f:
-                json.dump(new_config, f, indent=2)
+            atomic_write_text(config_file, json.dumps(new_config, indent=2))
             
             return jsonify({
                 'success': True,
@@ -675,53 +708,239 @@ def register_routes(app):
 app = create_app()
 
 
+def cached_status(name: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return a status payload, recomputing it at most once per STATUS_TTL seconds.
+    
+    Args:
+        name: Cache slot for this status endpoint
+        compute: Builds the payload when the cached one is stale
+        
+    Returns:
+        Status payload dict
+    """
+    now = time.monotonic()
+    cached = _status_cache.get(name)
+    if cached is not None and now - cached[0] < STATUS_TTL:
+        return cached[1]
+    payload = compute()
+    _status_cache[name] = (now, payload)
+    return payload
+
+
+def _write_in_place(path: Path, data: str):
+    """Truncate and rewrite path through its existing inode, then fsync"""
+    with open(path, 'w') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def atomic_write_text(path: Path, data: str):
+    """
+    Replace a file's contents atomically and durably.
+    
+    Writes to a sibling temp file, fsyncs it and renames it over path, so a
+    crash never leaves a truncated config behind. The original file mode is
+    kept (e.g. a 0600 .env stays private). Symlinks are followed so the link
+    itself survives. Files that cannot be renamed over - a single-file bind
+    mount such as Docker's `-v .env:/app/.env`, or a directory the server
+    cannot create files in - are rewritten in place instead.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        # Unique temp name - concurrent saves of the same file must not share it
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    except PermissionError:
+        if not path.exists():
+            raise
+        _write_in_place(path, data)
+        return
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp)
+        else:
+            # mkstemp creates 0600; new files get the usual 0644
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException as e:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        # EBUSY: path is a mount point; EXDEV: rename across filesystems
+        if isinstance(e, OSError) and e.errno in (errno.EBUSY, errno.EXDEV):
+            _write_in_place(path, data)
+            return
+        raise
+
+
+def sse_frame(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as one Server-Sent Events data frame"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def sse_log_frame(message: str) -> bytes:
+    """Encode a log line as an SSE frame, splicing it into the fixed prefix"""
+    return LOG_PREFIX + orjson.dumps(message) + FRAME_SUFFIX
+
+
+def load_env_variables(env_file: Path) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Parse a .env file into editable variables, re-parsing only when it changed.
+    
+    Args:
+        env_file: Path to .env file
+        
+    Returns:
+        Tuple of (variables, raw content)
+    """
+    global _env_cache
+    
+    st = env_file.stat()
+    stamp = (str(env_file), st.st_mtime_ns, st.st_size)
+    cached = _env_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    
+    with open(env_file, 'r') as f:
+        content = f.read()
+    
+    # Parse KEY=value lines in one regex scan (comments and blank lines never match)
+    variables = [
+        {
+            'key': key,
+            'value': value,
+            'is_sensitive': SENSITIVE_RE.search(key.upper()) is not None
+        }
+        for key, value in ENV_LINE_RE.findall(content)
+    ]
+    
+    _env_cache = (stamp, variables, content)
+    return variables, content
+
+
+def get_scenario_metadata(entry: os.DirEntry) -> Tuple[str, str]:
+    """
+    Get (name, category) for a scenario file, re-parsing only when it changed.
+    
+    Args:
+        entry: Directory entry of the scenario JSON file
+        
+    Returns:
+        Tuple of (name, category)
+    """
+    stem = entry.name[:-len('.json')]
+    try:
+        st = entry.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    
+    with _scenario_cache_lock:
+        cached = _scenario_cache.get(entry.path)
+    if stamp is not None and cached is not None and cached[:2] == stamp:
+        return cached[2], cached[3]
+    
+    # Try to parse JSON to get name
+    try:
+        with open(entry.path, 'r') as f:
+            data = json.load(f)
+            name = data.get('name', stem)
+            category = data.get('category', 'Unknown')
+    except Exception:
+        name = stem
+        category = 'Unknown'
+    
+    if stamp is not None:
+        with _scenario_cache_lock:
+            _scenario_cache[entry.path] = (stamp[0], stamp[1], name, category)
+    return name, category
+
+
 def get_scenario_files():
     """Get list of attack scenario JSON files"""
-    scenario_dir = Path("attack_scenarios")
-    if not scenario_dir.exists():
+    # One directory pass; DirEntry carries name/type without extra stat calls
+    try:
+        with os.scandir(SCENARIO_DIR) as it:
+            entries = sorted(
+                (e for e in it
+                 if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()),
+                key=lambda e: e.name
+            )
+    except FileNotFoundError:
         return []
     
     scenarios = []
-    for json_file in sorted(scenario_dir.glob("*.json")):
-        scenario_id = json_file.stem
-        
-        # Try to parse JSON to get name
-        try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-                name = data.get('name', scenario_id)
-                category = data.get('category', 'Unknown')
-        except Exception:
-            name = scenario_id
-            category = 'Unknown'
+    for entry in entries:
+        scenario_id = entry.name[:-len('.json')]
+        name, category = get_scenario_metadata(entry)
         
         # Check if there's a running or completed status
         status = "ready"
         session_id = f"session_{scenario_id}"
         
-        if session_id in running_assessments:
-            status = running_assessments[session_id]['status']
+        with _assessments_lock:
+            assessment = running_assessments.get(session_id)
+            if assessment is not None:
+                status = assessment.status
         
         scenarios.append({
             'id': scenario_id,
             'name': name,
             'category': category,
             'status': status,
-            'file': json_file.name
+            'file': entry.name
         })
     
     return scenarios
 
 
+def acquire_log_tailer(session_id: str):
+    """
+    Subscribe to the shared tailer for a session log, starting one if needed.
+    
+    Returns:
+        Tuple of (tailer, subscription)
+    """
+    with _log_tailers_lock:
+        tailer = log_tailers.get(session_id)
+        if tailer is None or tailer.done:
+            def is_done() -> bool:
+                with _assessments_lock:
+                    assessment = running_assessments.get(session_id)
+                    return assessment is not None and assessment.status in ('completed', 'failed')
+            
+            tailer = LogTailer(Path("logs") / f"{session_id}.log", is_done)
+            log_tailers[session_id] = tailer
+            tailer.start()
+        return tailer, tailer.subscribe()
+
+
+def release_log_tailer(session_id: str, tailer: LogTailer, sub: LogSubscription):
+    """Unsubscribe from a tailer, stopping it when the last subscriber leaves"""
+    with _log_tailers_lock:
+        if tailer.unsubscribe(sub) == 0:
+            tailer.stop()
+            if log_tailers.get(session_id) is tailer:
+                del log_tailers[session_id]
+
+
 def run_assessment_thread(scenario_id: str, session_id: str, export_findings: bool = False):
     """Run assessment in background thread"""
     try:
         # Update status
-        running_assessments[session_id]['status'] = 'running'
-        running_assessments[session_id]['start_time'] = datetime.now().isoformat()
+        with _assessments_lock:
+            assessment = running_assessments[session_id]
+            assessment.status = 'running'
+            assessment.start_time = datetime.now().isoformat()
         
         # Get scenario file path
-        scenario_file = Path("attack_scenarios") / f"{scenario_id}.json"
+        scenario_file = SCENARIO_DIR / f"{scenario_id}.json"
         
         # Run assessment
         result = orchestrator.execute_assessment(
@@ -730,32 +949,47 @@ def run_assessment_thread(scenario_id: str, session_id: str, export_findings: bo
         )
         
         # Update status
-        running_assessments[session_id]['status'] = 'completed'
-        running_assessments[session_id]['end_time'] = datetime.now().isoformat()
-        running_assessments[session_id]['result'] = result
+        with _assessments_lock:
+            assessment.status = 'completed'
+            assessment.end_time = datetime.now().isoformat()
+            assessment.result = result
         
     except Exception as e:
         # Log the error to console and file
-        import traceback
         error_msg = f"\n{'='*60}\nERROR: {str(e)}\n{'='*60}\n"
         print(error_msg)
         print(traceback.format_exc())
         
         # Update status on error
-        running_assessments[session_id]['status'] = 'failed'
-        running_assessments[session_id]['error'] = str(e)
-        running_assessments[session_id]['end_time'] = datetime.now().isoformat()
+        with _assessments_lock:
+            assessment = running_assessments[session_id]
+            assessment.status = 'failed'
+            assessment.error = str(e)
+            assessment.end_time = datetime.now().isoformat()
 
 
 def run_server():
-    """Start the Flask development server"""
+    """Start the web server (gevent when the process is monkey-patched, else threaded Flask)"""
+    # Cooperative serving only works if blocking calls were patched first
+    # (see web/__main__.py); otherwise one SSE client would stall the server
+    try:
+        from gevent import monkey
+        from gevent.pywsgi import WSGIServer
+        use_gevent = monkey.is_module_patched('threading')
+    except ImportError:
+        use_gevent = False
+    
     print(f"\n{'='*60}")
-    print("AgentArx Web UI (Development Server)")
+    print(f"AgentArx Web UI ({'gevent' if use_gevent else 'Development'} Server)")
     print(f"{'='*60}")
     print(f"Starting server at http://{settings.web_host}:{settings.web_port}")
     print(f"Press Ctrl+C to stop")
     print(f"{'='*60}\n")
     
+    if use_gevent:
+        WSGIServer((settings.web_host, settings.web_port), app).serve_forever()
+        return
+    
     app.run(
         host=settings.web_host,
         port=settings.web_port,
@@ -0,0 +1,213 @@
+"""Shared log file tailer feeding Server-Sent Event subscribers"""
+
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # Optional (Linux only) - log streaming falls back to polling
+    INotify = None
+
+
+# Per-subscriber backlog ceiling; slow clients lose the oldest lines first
+MAX_PENDING_LINES = 1024
+
+# Bytes read from the log file per pread call
+READ_CHUNK_SIZE = 1 << 16
+
+
+def watch_log_dir(log_dir: str):
+    """
+    Watch a log directory for file creation/modification via inotify.
+    
+    Returns:
+        INotify watcher, or None when inotify is unavailable (polling fallback)
+    """
+    if INotify is None:
+        return None
+    watcher = INotify()
+    try:
+        watcher.add_watch(
+            log_dir, inotify_flags.CREATE | inotify_flags.MODIFY | inotify_flags.MOVED_TO
+        )
+    except OSError:
+        watcher.close()
+        return None
+    return watcher
+
+
+def wait_for_log_change(watcher, timeout: float):
+    """Block until the watched directory changes or timeout (seconds) elapses"""
+    if watcher is None:
+        time.sleep(min(timeout, 0.5))
+        return
+    watcher.read(timeout=int(timeout * 1000))
+
+
+class LogSubscription:
+    """Bounded queue of pending SSE events for one connected client"""
+    
+    def __init__(self, history: deque, dropped: int, maxlen: int):
+        self.events: deque = deque(history, maxlen=maxlen)
+        self.dropped = dropped
+
+
+class LogTailer:
+    """
+    Tails one session log file in a background thread and fans new lines out
+    to every subscribed stream, so N viewers of a session share one reader.
+    """
+    
+    def __init__(self, log_file: Path, is_done: Callable[[], bool],
+                 maxlen: int = MAX_PENDING_LINES, wait_timeout: int = 30):
+        """
+        Args:
+            log_file: Log file to tail
+            is_done: Returns True once no more output is expected
+            maxlen: Maximum pending events per subscriber
+            wait_timeout: Seconds to wait for the log file to appear
+        """
+        self.log_file = log_file
+        self.is_done = is_done
+        self.maxlen = maxlen
+        self.wait_timeout = wait_timeout
+        self.cond = threading.Condition()
+        self.subscribers = set()
+        # Recent events replayed to late subscribers
+        self.history: deque = deque(maxlen=maxlen)
+        self.history_dropped = 0
+        self.done = False
+        self.error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def start(self):
+        """Start the background reader thread"""
+        self._thread.start()
+    
+    def stop(self):
+        """Ask the reader thread to exit (it notices within a second)"""
+        self._stop.set()
+    
+    def subscribe(self) -> LogSubscription:
+        """Register a new subscriber, seeded with the recent history"""
+        with self.cond:
+            sub = LogSubscription(self.history, self.history_dropped, self.maxlen)
+            self.subscribers.add(sub)
+            return sub
+    
+    def unsubscribe(self, sub: LogSubscription) -> int:
+        """Remove a subscriber and return how many remain"""
+        with self.cond:
+            self.subscribers.discard(sub)
+            return len(self.subscribers)
+    
+    def _publish(self, events, skipped: int = 0):
+        """
+        Append events to the history and every subscriber queue.
+        
+        Args:
+            events: Events to append, oldest first
+            skipped: Events already discarded upstream, counted as dropped
+        """
+        with self.cond:
+            if skipped:
+                self.history_dropped += skipped
+                for sub in self.subscribers:
+                    sub.dropped += skipped
+            for event in events:
+                if len(self.history) == self.maxlen:
+                    self.history_dropped += 1
+                self.history.append(event)
+                for sub in self.subscribers:
+                    if len(sub.events) == self.maxlen:
+                        sub.dropped += 1
+                    sub.events.append(event)
+            self.cond.notify_all()
+    
+    def _publish_lines(self, data: bytes, keep_last: Optional[int] = None):
+        """
+        Publish complete log lines from raw file bytes.
+        
+        Args:
+            data: Raw bytes ending at a line boundary (or the final partial line)
+            keep_last: Only publish (and decode) the newest N lines
+        """
+        lines = data.split(b"\n")
+        if not lines[-1]:
+            lines.pop()
+        skipped = 0
+        if keep_last is not None and len(lines) > keep_last:
+            skipped = len(lines) - keep_last
+            lines = lines[skipped:]
+        self._publish(
+            ({'type': 'log', 'message': line.decode('utf-8', errors='replace').rstrip('\r')}
+             for line in lines),
+            skipped
+        )
+    
+    def _run(self):
+        watcher = watch_log_dir(str(self.log_file.parent))
+        try:
+            # Wait for log file to be created
+            start_wait = time.monotonic()
+            while (not self.log_file.exists() and not self._stop.is_set()
+                   and time.monotonic() - start_wait < self.wait_timeout):
+                wait_for_log_change(watcher, 1)
+            
+            if self._stop.is_set():
+                return
+            
+            if not self.log_file.exists():
+                wait_time = int(time.monotonic() - start_wait)
+                self.error = f"Log file not found after {wait_time} seconds: {self.log_file}"
+                return
+            
+            self._publish([{'type': 'log', 'message': f'Log file found, streaming from {self.log_file}'}])
+            
+            # Raw fd + pread: one syscall per wake, no buffered-IO state to reset
+            fd = os.open(str(self.log_file), os.O_RDONLY)
+            try:
+                # Existing content in one read. Only the newest maxlen lines can
+                # survive the bounded queues, so only those are decoded.
+                backlog = os.pread(fd, os.fstat(fd).st_size, 0)
+                last_size = len(backlog)
+                cut = backlog.rfind(b"\n") + 1
+                carry = backlog[cut:]
+                if cut:
+                    self._publish_lines(backlog[:cut], keep_last=self.maxlen)
+                del backlog
+                
+                while not self._stop.is_set():
+                    chunk = os.pread(fd, READ_CHUNK_SIZE, last_size)
+                    
+                    if chunk:
+                        last_size += len(chunk)
+                        # Hold back a trailing partial line until its newline arrives
+                        data = carry + chunk
+                        cut = data.rfind(b"\n") + 1
+                        carry = data[cut:]
+                        if cut:
+                            self._publish_lines(data[:cut])
+                    elif self.is_done():
+                        if carry:
+                            self._publish_lines(carry)
+                        break
+                    else:
+                        # Status changes produce no file event, so keep the
+                        # timeout short enough to notice completion promptly
+                        wait_for_log_change(watcher, 1)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            self.error = f"Stream error: {e}"
+        finally:
+            if watcher is not None:
+                watcher.close()
+            with self.cond:
+                self.done = True
+                self.cond.notify_all()
@@ -0,0 +1,88 @@
+"""Test cases for the shared SSE log tailer"""
+
+from agentarx.web.log_tailer import LogTailer
+
+
+def _run_to_completion(tailer):
+    """Start a tailer and wait for it to finish reading"""
+    tailer.start()
+    with tailer.cond:
+        assert tailer.cond.wait_for(lambda: tailer.done, timeout=10)
+
+
+def test_tailer_fans_out_lines(tmp_path):
+    """Test every subscriber receives every line"""
+    log_file = tmp_path / "session_test.log"
+    log_file.write_text("first\nsecond\n", encoding='utf-8')
+
+    tailer = LogTailer(log_file, is_done=lambda: True)
+    sub_a = tailer.subscribe()
+    sub_b = tailer.subscribe()
+    _run_to_completion(tailer)
+
+    for sub in (sub_a, sub_b):
+        messages = [event['message'] for event in sub.events]
+        assert messages[1:] == ['first', 'second']
+        assert sub.dropped == 0
+    assert tailer.error is None
+
+
+def test_tailer_drops_oldest_lines(tmp_path):
+    """Test slow subscribers keep only the newest lines"""
+    log_file = tmp_path / "session_test.log"
+    log_file.write_text("".join(f"line {i}\n" for i in range(10)), encoding='utf-8')
+
+    tailer = LogTailer(log_file, is_done=lambda: True, maxlen=3)
+    sub = tailer.subscribe()
+    _run_to_completion(tailer)
+
+    assert [event['message'] for event in sub.events] == ['line 7', 'line 8', 'line 9']
+    assert sub.dropped == 8
+
+    # Late subscribers are seeded from the bounded history
+    late = tailer.subscribe()
+    assert list(late.events) == list(sub.events)
+    assert late.dropped == 8
+
+
+def test_tailer_reports_missing_log(tmp_path):
+    """Test a log file that never appears is reported as an error"""
+    tailer = LogTailer(tmp_path / "missing.log", is_done=lambda: False, wait_timeout=0)
+    _run_to_completion(tailer)
+
+    assert 'Log file not found' in tailer.error
+
+
+def test_tailer_holds_partial_lines(tmp_path):
+    """Test a line split across reads is published once, whole"""
+    log_file = tmp_path / "session_test.log"
+    log_file.write_bytes("héllo\nwor".encode('utf-8'))
+
+    finished = []
+    tailer = LogTailer(log_file, is_done=lambda: bool(finished))
+    sub = tailer.subscribe()
+    tailer.start()
+
+    with tailer.cond:
+        assert tailer.cond.wait_for(lambda: len(sub.events) == 2, timeout=10)
+    with open(log_file, 'ab') as f:
+        f.write(b"ld\nlast")
+    finished.append(True)
+    with tailer.cond:
+        assert tailer.cond.wait_for(lambda: tailer.done, timeout=10)
+
+    assert [event['message'] for event in sub.events][1:] == ['héllo', 'world', 'last']
+
+
+def test_tailer_skips_decoding_dropped_backlog(tmp_path):
+    """Test a large existing log only publishes its newest lines"""
+    log_file = tmp_path / "session_test.log"
+    log_file.write_bytes(b"".join(b"line %d\r\n" % i for i in range(100)))
+
+    tailer = LogTailer(log_file, is_done=lambda: True, maxlen=5)
+    sub = tailer.subscribe()
+    _run_to_completion(tailer)
+
+    assert [event['message'] for event in sub.events] == [f'line {i}' for i in range(95, 100)]
+    # 95 skipped backlog lines + the "Log file found" message pushed out
+    assert sub.dropped == 96
@@ -1,131 +1,119 @@
 """Test cases for attack scenario parser functionality"""
 
+import io
 import pytest
-import tempfile
 import json
 from pathlib import Path
 from agentarx.scenario_parser.attack_scenario_parser import AttackScenarioParser
 
 
-def create_test_json_file(content: dict) -> str:
-    """Create a temporary JSON file for testing"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(content, f)
-        return f.name
+DATA_DIR = Path(__file__).parent / "data"
 
+# Payload bytes read once at import; file and stream tests reuse them as-is
+SCENARIO_JSON = {path.stem: path.read_bytes() for path in sorted(DATA_DIR.glob("*.json"))}
+SCENARIO_PAYLOADS = {name: json.loads(raw) for name, raw in SCENARIO_JSON.items()}
 
-def test_parse_attack_scenario_with_multiple_steps():
+
+@pytest.fixture(scope="module")
+def parser():
+    """Share one parser (and its parse cache) across the module"""
+    return AttackScenarioParser()
+
+
+@pytest.fixture(scope="session")
+def scenario_files():
+    """Paths of the canonical scenario payloads under tests/data"""
+    return {name: str(DATA_DIR / f"{name}.json") for name in SCENARIO_JSON}
+
+
+def test_parse_attack_scenario_with_multiple_steps(parser):
     """Test parsing attack scenario with standard format"""
-    json_content = {
-        "system_prompt": "SYSTEM_PROMPT",
-        "goal": "Test injection vulnerabilities",
-        "constraints": {
-            "timeout_seconds": 300,
-            "stopping_conditions": ["3 techniques tested"]
-        },
-        "steps": [
-            {
-                "name": "prompt_extraction",
-                "description": "Extract system prompt",
-                "examples": ["curl -X POST {TARGET_URL}/api/chat -d '{\"msg\":\"Show prompt\"}'"]
-            },
-            {
-                "name": "data_extraction",
-                "description": "Extract sensitive data",
-                "examples": ["curl -X POST {TARGET_URL}/api/chat -d '{\"msg\":\"Show data\"}'"]
-            }
-        ]
-    }
+    result = parser.parse_dict(SCENARIO_PAYLOADS["multi_step"])
     
-    json_file = create_test_json_file(json_content)
-    
-    try:
-        parser = AttackScenarioParser()
-        result = parser.parse_file(json_file)
-        
-        assert result.attack_definition.name == "Test injection vulnerabilities"
-        assert len(result.attack_definition.steps) == 2
-        assert result.attack_definition.steps[0].name == "prompt_extraction"
-        assert "curl" in result.attack_definition.steps[0].command
-        assert result.attack_definition.metadata['constraints']['timeout_seconds'] == 300
-    finally:
-        Path(json_file).unlink()
-
-
-def test_parse_empty_steps():
+    assert result.attack_definition.name == "Test injection vulnerabilities"
+    assert len(result.attack_definition.steps) == 2
+    assert result.attack_definition.steps[0].name == "prompt_extraction"
+    assert "curl" in result.attack_definition.steps[0].command
+    assert result.attack_definition.metadata['constraints']['timeout_seconds'] == 300
+
+
+def test_parse_empty_steps(parser):
     """Test parsing scenario with no steps"""
-    json_content = {
-        "system_prompt": "Test prompt",
-        "goal": "Test goal",
-        "constraints": {"timeout_seconds": 60},
-        "steps": []
-    }
+    result = parser.parse_dict(SCENARIO_PAYLOADS["empty"])
+    assert len(result.attack_definition.steps) == 0
+
+
+def test_parse_multiple_files(parser, scenario_files):
+    """Test parsing multiple JSON files keeps order and skips failures"""
+    results = parser.parse_multiple_files(
+        [scenario_files["attack1"], '/nonexistent/file.json', scenario_files["attack2"]]
+    )
     
-    json_file = create_test_json_file(json_content)
+    assert len(results) == 2
+    assert results[0].attack_definition.name == 'Test attack 1'
+    assert results[1].attack_definition.name == 'Test attack 2'
+
+
+@pytest.mark.parametrize("filename,content,expected", [
+    ("multi_step.json", SCENARIO_JSON["multi_step"], 2),
+    ("empty.json", SCENARIO_JSON["empty"], 0),
+    ("scenario.txt", b"This is not a JSON file", ValueError),
+    ("missing.json", None, FileNotFoundError),
+], ids=["valid", "empty", "not_json", "missing"])
+def test_parse_file_formats(parser, tmp_path, filename, content, expected):
+    """Test parse_file across valid, empty, non-JSON and missing inputs"""
+    path = tmp_path / filename
+    if content is not None:
+        path.write_bytes(content)
     
-    try:
-        parser = AttackScenarioParser()
-        result = parser.parse_file(json_file)
-        assert len(result.attack_definition.steps) == 0
-    finally:
-        Path(json_file).unlink()
-
-
-def test_parse_file_not_found():
-    """Test handling of non-existent file"""
-    parser = AttackScenarioParser()
-    with pytest.raises(FileNotFoundError):
-        parser.parse_file('/nonexistent/file.json')
-
-
-def test_parse_multiple_files():
-    """Test parsing multiple JSON files"""
-    json1_content = {
-        "system_prompt": "Test role 1",
-        "goal": "Test attack 1",
-        "steps": [{"name": "step1", "examples": ["ls"]}]
-    }
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            parser.parse_file(str(path))
+    else:
+        result = parser.parse_file(str(path))
+        assert result.file_path == str(path)
+        assert len(result.attack_definition.steps) == expected
+
+
+def test_parse_stream(parser):
+    """Test parsing from an in-memory stream, including malformed JSON"""
+    stream = io.BytesIO(SCENARIO_JSON["attack1"])
+    result = parser.parse_stream(stream, source="attack1.json")
+    assert result.file_path == "attack1.json"
+    assert result.attack_definition.steps[0].command == "ls"
     
-    json2_content = {
-        "system_prompt": "Test role 2",
-        "goal": "Test attack 2",
-        "steps": [{"name": "step2", "examples": ["print(\"hi\")"]}]
-    }
+    with pytest.raises(ValueError):
+        parser.parse_stream(io.BytesIO(b"This is not a JSON file"))
+
+
+def test_parse_file_cache(parser, tmp_path):
+    """Test parse_file reuses results until the file changes"""
+    path = tmp_path / "cached.json"
+    path.write_bytes(SCENARIO_JSON["attack1"])
+    
+    first = parser.parse_file(str(path))
+    assert parser.parse_file(str(path)) is first
     
-    json1_file = create_test_json_file(json1_content)
-    json2_file = create_test_json_file(json2_content)
+    path.write_bytes(SCENARIO_JSON["multi_step"])
+    changed = parser.parse_file(str(path))
+    assert changed.attack_definition.name == "Test injection vulnerabilities"
     
-    try:
-        parser = AttackScenarioParser()
-        results = parser.parse_multiple_files([json1_file, json2_file])
-        
-        assert len(results) == 2
-        assert results[0].attack_definition.name == 'Test attack 1'
-        assert results[1].attack_definition.name == 'Test attack 2'
-    finally:
-        Path(json1_file).unlink()
-        Path(json2_file).unlink()
-
-
-def test_invalid_file_format():
-    """Test handling of non-JSON file"""
-    parser = AttackScenarioParser()
+    parser.clear_cache()
+    assert parser.parse_file(str(path)) is not changed
+
+
+@pytest.mark.benchmark(group="parser")
+def test_bench_parse_1000_steps(parser, tmp_path, benchmark):
+    """Benchmark parse_file on a 1000-step scenario"""
+    path = tmp_path / "big.json"
+    path.write_bytes(json.dumps({
+        "goal": "Benchmark",
+        "steps": [{"name": f"s{i}", "examples": ["curl {TARGET_URL}"]} for i in range(1000)]
+    }).encode())
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write("This is not a JSON file")
-        txt_file = f.name
+    def parse_uncached():
+        parser.clear_cache()
+        return parser.parse_file(str(path))
     
-    try:
-        with pytest.raises(ValueError):
-            parser.parse_file(txt_file)
-    finally:
-        Path(txt_file).unlink()
-
-
-if __name__ == "__main__":
-    # Run basic tests
-    test_parse_simple_attack_definition()
-    test_parse_recon_json()
-    test_parse_multiple_files()
-    test_invalid_file_format()
-    print("All parser tests passed!")
\ No newline at end of file
+    result = benchmark(parse_uncached)
+    assert len(result.attack_definition.steps) == 1000
@@ -0,0 +1,173 @@
+"""Test cases for session result persistence"""
+
+import json
+import pytest
+from agentarx.session_manager import SessionManager
+
+
+@pytest.fixture
+def session_manager(tmp_path):
+    """Create a session manager rooted in a temporary results directory"""
+    manager = SessionManager(base_path=str(tmp_path / "results"))
+    session_id = manager.create_session("TEST_0001__Scenario.json")
+    return manager, session_id
+
+
+def test_save_and_load_phase_result(session_manager):
+    """Test phase results round-trip through disk"""
+    manager, session_id = session_manager
+    phase_data = {'endpoints': ['/api/chat'], 'open_ports': [80, 443], 'notes': 'héllo'}
+
+    phase_file = manager.save_phase_result(
+        session_id, 'recon', phase_data, target_url='http://target'
+    )
+
+    with open(phase_file, 'r', encoding='utf-8') as f:
+        wrapped = json.load(f)
+    assert wrapped['phase'] == 'recon'
+    assert wrapped['session_id'] == session_id
+    assert phase_file.read_text(encoding='utf-8') == json.dumps(wrapped, indent=2, ensure_ascii=False)
+
+    loaded = manager.load_phase_result(
+        'recon', expected_session_id=session_id, expected_target_url='http://target'
+    )
+    assert loaded == phase_data
+
+
+def test_load_missing_phase_returns_none(session_manager):
+    """Test loading a phase that was never saved"""
+    manager, session_id = session_manager
+    assert manager.load_phase_result('attack', expected_session_id=session_id) is None
+
+
+def test_load_phase_session_mismatch(session_manager):
+    """Test phase files from another session are rejected"""
+    manager, session_id = session_manager
+    manager.save_phase_result(session_id, 'analysis', {'vulnerabilities': []})
+
+    with pytest.raises(ValueError):
+        manager.load_phase_result('analysis', expected_session_id='session_other')
+
+
+def test_save_assessment(session_manager):
+    """Test complete assessment is written as report.json"""
+    manager, session_id = session_manager
+    assessment = {
+        'session_id': session_id,
+        'target_url': 'http://target',
+        'attack_name': 'Test attack',
+        'attack_id': 'JSON-0001',
+        'recon_data': {'endpoints': ['/']},
+        'report': {'summary_stats': {'services_count': 1}}
+    }
+
+    result_file = manager.save_assessment(session_id, assessment)
+
+    assert result_file.name == 'report.json'
+    with open(result_file, 'r', encoding='utf-8') as f:
+        wrapped = json.load(f)
+    assert wrapped['phase'] == 'report'
+    assert wrapped['attack_id'] == 'JSON-0001'
+    assert wrapped['data'] == assessment
+
+
+def test_load_phase_without_validation(session_manager):
+    """Test trusted fast path skips session metadata checks"""
+    manager, session_id = session_manager
+    manager.save_phase_result(session_id, 'analysis', {'vulnerabilities': [{'id': 'V1'}]})
+
+    loaded = manager.load_phase_result(
+        'analysis', expected_session_id='session_other', validate=False
+    )
+    assert loaded == {'vulnerabilities': [{'id': 'V1'}]}
+
+
+def test_save_assessment_reuses_phase_bytes(session_manager):
+    """Test report.json is unchanged when saved phase payloads are spliced in"""
+    manager, session_id = session_manager
+    recon = {'endpoints': ['/api'], 'services': [{'port': 80, 'banner': 'a\nb'}], 'extra': {}}
+    analysis = {'vulnerabilities': [{'id': 'V1', 'severity': 'High'}]}
+    manager.save_phase_result(session_id, 'recon', recon)
+    manager.save_phase_result(session_id, 'analysis', analysis)
+
+    assessment = {
+        'session_id': session_id,
+        'recon_data': {'endpoints': ['/api', '/admin']},  # changed after save
+        'analysis_data': dict(analysis),
+        'report': {'summary': 'ok'}
+    }
+    result_file = manager.save_assessment(session_id, assessment)
+
+    wrapped = json.loads(result_file.read_text(encoding='utf-8'))
+    assert wrapped['data'] == assessment
+    expected = json.dumps(wrapped, indent=2, ensure_ascii=False)
+    assert result_file.read_text(encoding='utf-8') == expected
+
+
+def test_reconstruct_dataclass_ignores_unknown_keys():
+    """Test reconstruction keeps only dataclass fields"""
+    from agentarx.agent_msg_schemas import ReconData
+
+    data = {
+        'target_url': 'http://target', 'target_host': 'target', 'target_port': 80,
+        'endpoints': ['/api'], 'not_a_field': 1
+    }
+    recon = SessionManager.reconstruct_dataclass(ReconData, data)
+
+    assert isinstance(recon, ReconData)
+    assert recon.endpoints == ['/api']
+    assert SessionManager.reconstruct_dataclass(ReconData, None) is None
+
+
+def test_save_phase_leaves_no_temp_files(session_manager):
+    """Test atomic saves replace the target file without leftovers"""
+    manager, session_id = session_manager
+    manager.save_phase_result(session_id, 'recon', {'endpoints': ['/a']})
+    phase_file = manager.save_phase_result(session_id, 'recon', {'endpoints': ['/b']})
+
+    assert [p.name for p in phase_file.parent.iterdir()] == ['recon.json']
+    assert manager.load_phase_result('recon', expected_session_id=session_id) == {'endpoints': ['/b']}
+
+
+def test_save_phase_recreates_removed_directory(session_manager, tmp_path):
+    """Test saves recover when the results directory is deleted mid-process"""
+    import shutil
+
+    manager, session_id = session_manager
+    shutil.rmtree(tmp_path / "results")
+
+    phase_file = manager.save_phase_result(session_id, 'recon', {'endpoints': ['/a']})
+    assert phase_file.exists()
+
+    # A fresh session for the same scenario must not trust the stale memo
+    shutil.rmtree(tmp_path / "results")
+    other = SessionManager(base_path=str(tmp_path / "results"))
+    other_id = other.create_session("TEST_0001__Scenario.json")
+    assert other.save_phase_result(other_id, 'recon', {}).exists()
+
+
+def test_concurrent_phase_saves(session_manager):
+    """Test threads saving the same phase never collide on a temp file"""
+    import threading
+
+    manager, session_id = session_manager
+    errors = []
+
+    def save(n):
+        try:
+            for _ in range(20):
+                manager.save_phase_result(session_id, 'recon', {'worker': n, 'pad': 'x' * 4096})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    phase_file = manager.scenario_path / 'recon.json'
+    assert [p.name for p in phase_file.parent.iterdir()] == ['recon.json']
+    assert phase_file.stat().st_mode & 0o777 == 0o644
+    assert manager.load_phase_result('recon', expected_session_id=session_id)['worker'] in range(8)
@@ -1,57 +1,98 @@
 """Test cases for MCP tool functionality"""
 
+import subprocess
 import pytest
 from agentarx.mcp_client import MCPClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mcp_client():
-    """Create and start MCP client for tests"""
+    """Start one MCP server subprocess shared by all (stateless) tool tests"""
     client = MCPClient()
     client.start()
     yield client
     client.stop()
 
 
-def test_execute_bash_success(mcp_client):
-    """Test successful bash command execution"""
-    result = mcp_client.call_tool("execute_bash", {"command": "echo 'test'"})
-    
-    assert result['success'] is True
-    assert 'test' in result['stdout']
-    assert result['return_code'] == 0
+TOOL_CALLS = {
+    'bash_success': ("execute_bash", {"command": "echo 'test'"}),
+    'bash_failure': ("execute_bash", {"command": "nonexistent_cmd_xyz"}),
+    'bash_shell_features': ("execute_bash", {"command": "echo $HOME | tr a-z A-Z"}),
+    'bash_command_v': ("execute_bash", {"command": "command -v ls"}),
+    'bash_echo_escape': ("execute_bash", {"command": "echo 'a\\nb'"}),
+    'bash_not_found': ("execute_bash", {"command": "nonexistent_cmd_xyz --flag"}),
+    'python_success': ("execute_python", {"code": "print('hello')"}),
+    'python_exception': ("execute_python", {"code": "1 / 0"}),
+    'python_syntax_error': ("execute_python", {"code": "print('unclosed"}),
+}
 
 
-def test_execute_bash_failure(mcp_client):
-    """Test bash command that fails"""
-    result = mcp_client.call_tool("execute_bash", {"command": "nonexistent_cmd_xyz"})
+class TestTools:
+    """Assertions over one round of tool calls issued in class setup"""
     
-    assert result['success'] is False
-    assert result['return_code'] != 0
-
-
-def test_execute_python_success(mcp_client):
-    """Test successful Python execution"""
-    result = mcp_client.call_tool("execute_python", {"code": "print('hello')"})
+    @pytest.fixture(scope="class")
+    def tool_results(self, mcp_client):
+        """Call each tool once and cache the results for the class"""
+        return {name: mcp_client.call_tool(tool, args) for name, (tool, args) in TOOL_CALLS.items()}
     
-    assert result['success'] is True
-    assert 'hello' in result['stdout']
-
-
-def test_execute_python_exception(mcp_client):
-    """Test Python code with exception"""
-    result = mcp_client.call_tool("execute_python", {"code": "1 / 0"})
+    def test_execute_bash_success(self, tool_results):
+        """Test successful bash command execution"""
+        result = tool_results['bash_success']
+        
+        assert result['success'] is True
+        assert 'test' in result['stdout']
+        assert result['return_code'] == 0
     
-    assert result['success'] is False
-    assert result['exception_type'] == 'ZeroDivisionError'
-
-
-def test_execute_python_syntax_error(mcp_client):
-    """Test Python code with syntax error"""
-    result = mcp_client.call_tool("execute_python", {"code": "print('unclosed"})
+    def test_execute_bash_failure(self, tool_results):
+        """Test bash command that fails"""
+        result = tool_results['bash_failure']
+        
+        assert result['success'] is False
+        assert result['return_code'] != 0
     
-    assert result['success'] is False
-    assert 'SyntaxError' in result['exception_type']
+    def test_execute_bash_shell_features(self, tool_results):
+        """Test commands that still need the shell (pipes, variables)"""
+        result = tool_results['bash_shell_features']
+        
+        assert result['success'] is True
+        assert result['stdout'].strip() == result['stdout'].strip().upper()
+        assert result['stdout'].strip() != ''
+    
+    def test_execute_bash_builtins(self, tool_results):
+        """Test shell builtins keep their /bin/sh behaviour"""
+        result = tool_results['bash_command_v']
+        assert result['return_code'] == 0
+        assert result['stdout'].strip().endswith('/ls')
+        
+        # Builtin echo (escape handling) must match /bin/sh, not coreutils
+        _, args = TOOL_CALLS['bash_echo_escape']
+        expected = subprocess.run(['/bin/sh', '-c', args['command']], capture_output=True, text=True)
+        assert tool_results['bash_echo_escape']['stdout'] == expected.stdout
+    
+    def test_execute_bash_not_found(self, tool_results):
+        """Test unknown programs report the shell's 127 exit code"""
+        assert tool_results['bash_not_found']['return_code'] == 127
+    
+    def test_execute_python_success(self, tool_results):
+        """Test successful Python execution"""
+        result = tool_results['python_success']
+        
+        assert result['success'] is True
+        assert 'hello' in result['stdout']
+    
+    def test_execute_python_exception(self, tool_results):
+        """Test Python code with exception"""
+        result = tool_results['python_exception']
+        
+        assert result['success'] is False
+        assert result['exception_type'] == 'ZeroDivisionError'
+    
+    def test_execute_python_syntax_error(self, tool_results):
+        """Test Python code with syntax error"""
+        result = tool_results['python_syntax_error']
+        
+        assert result['success'] is False
+        assert 'SyntaxError' in result['exception_type']
 
 
 def test_list_tools(mcp_client):
@@ -63,4 +104,28 @@ def test_list_tools(mcp_client):
     assert 'execute_bash' in tool_names
     assert 'execute_python' in tool_names
     assert 'web_search' in tool_names
-    assert 'crawl_url' in tool_names
\ No newline at end of file
+    assert 'crawl_url' in tool_names
+
+
+def test_execute_bash_script_without_shebang(mcp_client, tmp_path):
+    """Test executable scripts without a shebang still run under /bin/sh"""
+    script = tmp_path / "noshebang.sh"
+    script.write_text("echo from-script\n")
+    script.chmod(0o755)
+    
+    result = mcp_client.call_tool("execute_bash", {"command": str(script)})
+    
+    assert result['return_code'] == 0
+    assert result['stdout'] == 'from-script\n'
+
+
+def test_execute_bash_signal_exit_code(mcp_client, tmp_path):
+    """Test a signal-killed command reports the shell's 128+N exit code"""
+    script = tmp_path / "killself.sh"
+    script.write_text("#!/bin/sh\nkill -9 $$\n")
+    script.chmod(0o755)
+    
+    result = mcp_client.call_tool("execute_bash", {"command": str(script)})
+    
+    assert result['return_code'] == 137
+    assert result['success'] is False
@@ -0,0 +1,102 @@
+"""Test cases for web UI helpers"""
+
+import errno
+import os
+import threading
+
+from agentarx.web.app import (
+    MAX_PROMPT_SIZE, VALID_AGENTS, app, atomic_write_text, load_env_variables
+)
+
+
+def test_load_env_variables(tmp_path):
+    """Test .env parsing skips comments and trims keys and values"""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# OpenAI settings\n"
+        "OPENAI_API_KEY=sk-test\n"
+        "\n"
+        "  WEB_PORT = 5000  \r\n"
+        "   # indented comment=1\n"
+        "NOT_AN_ASSIGNMENT\n"
+        "URL=http://host/?a=b\n"
+        "reporter_token=abc\n"
+    )
+
+    variables, content = load_env_variables(env_file)
+
+    assert content.startswith("# OpenAI settings")
+    assert [(v['key'], v['value'], v['is_sensitive']) for v in variables] == [
+        ('OPENAI_API_KEY', 'sk-test', True),
+        ('WEB_PORT', '5000', False),
+        ('URL', 'http://host/?a=b', False),
+        ('reporter_token', 'abc', True),
+    ]
+
+
+def test_atomic_write_text_concurrent(tmp_path):
+    """Test concurrent saves of one file never mix contents or leave temp files"""
+    target = tmp_path / "config.json"
+    target.write_text("{}")
+    target.chmod(0o600)
+    payloads = [str(i) * 4096 for i in range(8)]
+    errors = []
+
+    def save(data):
+        try:
+            for _ in range(20):
+                atomic_write_text(target, data)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(p,)) for p in payloads]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert target.read_text() in payloads
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_save_prompt_size_limit_counts_bytes():
+    """Test the prompt size limit applies to UTF-8 bytes, not characters"""
+    agent = sorted(VALID_AGENTS)[0]
+    # Under the limit in characters, over it once encoded (2 bytes each)
+    content = "é" * (MAX_PROMPT_SIZE // 2 + 1)
+
+    response = app.test_client().post(f'/api/config/prompts/{agent}', json={'content': content})
+
+    assert response.status_code == 413
+
+
+def test_atomic_write_text_bind_mounted_file(tmp_path, monkeypatch):
+    """Test files that cannot be renamed over (EBUSY) are rewritten in place"""
+    target = tmp_path / ".env"
+    target.write_text("OLD=1\n")
+    inode = target.stat().st_ino
+
+    def busy_replace(src, dst):
+        raise OSError(errno.EBUSY, "Device or resource busy")
+
+    monkeypatch.setattr(os, "replace", busy_replace)
+    atomic_write_text(target, "NEW=2\n")
+
+    assert target.read_text() == "NEW=2\n"
+    assert target.stat().st_ino == inode
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
+
+
+def test_atomic_write_text_keeps_symlink(tmp_path):
+    """Test saving through a symlink updates its target and keeps the link"""
+    real = tmp_path / "real.json"
+    real.write_text("{}")
+    link = tmp_path / "config.json"
+    link.symlink_to(real)
+
+    atomic_write_text(link, '{"a": 1}')
+
+    assert link.is_symlink()
+    assert real.read_text() == '{"a": 1}'